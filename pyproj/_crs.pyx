@@ -23,6 +23,24 @@ cdef dict _PJ_ELLPS_NAME_MAP = {
 }
 
 
+# Lookup tables for the supported output formats
+# built once instead of on every export
+cdef dict _WKT_TYPE_MAP = {
+    WktVersion.WKT2_2015: PJ_WKT2_2015,
+    WktVersion.WKT2_2015_SIMPLIFIED: PJ_WKT2_2015_SIMPLIFIED,
+    WktVersion.WKT2_2018: PJ_WKT2_2019,
+    WktVersion.WKT2_2018_SIMPLIFIED: PJ_WKT2_2019_SIMPLIFIED,
+    WktVersion.WKT2_2019: PJ_WKT2_2019,
+    WktVersion.WKT2_2019_SIMPLIFIED: PJ_WKT2_2019_SIMPLIFIED,
+    WktVersion.WKT1_GDAL: PJ_WKT1_GDAL,
+    WktVersion.WKT1_ESRI: PJ_WKT1_ESRI
+}
+cdef dict _PROJ_STRING_TYPE_MAP = {
+    ProjVersion.PROJ_4: PJ_PROJ_4,
+    ProjVersion.PROJ_5: PJ_PROJ_5,
+}
+
+
 cdef str decode_or_undefined(const char* instring):
     pystr = cstrdecode(instring)
     if pystr is None:
@@ -90,18 +108,8 @@ cdef _to_wkt(
     str or None
     """
     # get the output WKT format
-    supported_wkt_types = {
-        WktVersion.WKT2_2015: PJ_WKT2_2015,
-        WktVersion.WKT2_2015_SIMPLIFIED: PJ_WKT2_2015_SIMPLIFIED,
-        WktVersion.WKT2_2018: PJ_WKT2_2019,
-        WktVersion.WKT2_2018_SIMPLIFIED: PJ_WKT2_2019_SIMPLIFIED,
-        WktVersion.WKT2_2019: PJ_WKT2_2019,
-        WktVersion.WKT2_2019_SIMPLIFIED: PJ_WKT2_2019_SIMPLIFIED,
-        WktVersion.WKT1_GDAL: PJ_WKT1_GDAL,
-        WktVersion.WKT1_ESRI: PJ_WKT1_ESRI
-    }
     cdef PJ_WKT_TYPE wkt_out_type
-    wkt_out_type = supported_wkt_types[WktVersion.create(version)]
+    wkt_out_type = _WKT_TYPE_MAP[WktVersion.create(version)]
 
     cdef const char* options_wkt[3]
     cdef bytes multiline = b"MULTILINE=NO"
@@ -148,12 +156,8 @@ cdef _to_proj4(
     str: The PROJ string.
     """
     # get the output PROJ string format
-    supported_prj_types = {
-        ProjVersion.PROJ_4: PJ_PROJ_4,
-        ProjVersion.PROJ_5: PJ_PROJ_5,
-    }
     cdef PJ_PROJ_STRING_TYPE proj_out_type
-    proj_out_type = supported_prj_types[ProjVersion.create(version)]
+    proj_out_type = _PROJ_STRING_TYPE_MAP[ProjVersion.create(version)]
 
     cdef const char* options[2]
     cdef bytes multiline = b"MULTILINE=NO"
@@ -8,14 +8,16 @@ __all__ = [
     "Transformer",
     "TransformerGroup",
     "AreaOfInterest",
+    "clear_transformer_cache",
 ]
+import functools
 import threading
 import warnings
 from abc import ABC, abstractmethod
 from array import array
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from itertools import chain, islice
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import Any, overload
 
@@ -28,11 +30,39 @@ from pyproj._transformer import (  # noqa: F401 pylint: disable=unused-import
     _Transformer,
     _TransformerGroup,
 )
-from pyproj.datadir import get_user_data_dir
+from pyproj.datadir import get_data_dir, get_user_data_dir
 from pyproj.enums import ProjVersion, TransformDirection, WktVersion
 from pyproj.exceptions import ProjError
+from pyproj.network import is_network_enabled
 from pyproj.sync import _download_resource_file
-from pyproj.utils import _convertback, _copytobuffer
+from pyproj.utils import _convertback, _copytobuffer, _is_double_c_array
+
+_DEPRECATION_MSG = (
+    "This function is deprecated. "
+    "See: https://pyproj4.github.io/pyproj/stable/"
+    "gotchas.html#upgrading-to-pyproj-2-from-pyproj-1"
+)
+# Default number of points transformed per PROJ call in itransform.
+# 8192 points with up to 4 coordinates is 256 KB, which keeps
+# the working set of each batch within a typical L2 cache.
+_ITRANSFORM_TILE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=32)
+def _crs_from_hashable_input(crs_input: str | int) -> CRS:
+    return CRS.from_user_input(crs_input)
+
+
+def _crs_from_user_input(crs_input: Any) -> CRS:
+    """
+    Same as :meth:`pyproj.crs.CRS.from_user_input`, but re-uses
+    the CRS created previously for the same string or integer input.
+    """
+    if isinstance(crs_input, CRS):
+        return crs_input
+    if isinstance(crs_input, (str, int)):
+        return _crs_from_hashable_input(crs_input)
+    return CRS.from_user_input(crs_input)
 
 
 class TransformerMaker(ABC):
@@ -205,8 +235,8 @@ class TransformerGroup(_TransformerGroup):
 
         """
         super().__init__(
-            CRS.from_user_input(crs_from)._crs,
-            CRS.from_user_input(crs_to)._crs,
+            _crs_from_user_input(crs_from)._crs,
+            _crs_from_user_input(crs_to)._crs,
             always_xy=always_xy,
             area_of_interest=area_of_interest,
             authority=authority,
@@ -214,18 +244,20 @@ class TransformerGroup(_TransformerGroup):
             allow_ballpark=allow_ballpark,
             allow_superseded=allow_superseded,
         )
-        for iii, transformer in enumerate(self._transformers):
-            # pylint: disable=unsupported-assignment-operation
-            self._transformers[iii] = Transformer(TransformerUnsafe(transformer))
 
-    @property
+    @functools.cached_property
     def transformers(self) -> list["Transformer"]:
         """
         list[:obj:`Transformer`]:
             List of available :obj:`Transformer`
             associated with the transformation.
         """
-        return self._transformers
+        # created on first access as only unavailable_operations
+        # & best_available are needed in some cases (e.g. download_grids)
+        return [
+            Transformer(TransformerUnsafe(transformer))
+            for transformer in self._transformers  # pylint: disable=not-an-iterable
+        ]
 
     @property
     def unavailable_operations(self) -> list[CoordinateOperation]:
@@ -288,6 +320,8 @@ class TransformerGroup(_TransformerGroup):
                     )
                 elif not grid.available and verbose:
                     warnings.warn(f"Skipped: {grid}")
+        # the best transformation may be different with the new grids
+        clear_transformer_cache()
 
     def __repr__(self) -> str:
         return (
@@ -310,6 +344,63 @@ class TransformerLocal(threading.local):
         super().__init__()
 
 
+def _point_buffer_view(points: Any) -> memoryview | None:
+    """
+    Returns a memoryview of the points if they are stored in a
+    C contiguous 2D buffer of doubles (e.g. a (N, 2) float64 numpy array).
+    Otherwise, returns None.
+    """
+    try:
+        point_view = memoryview(points)
+    except TypeError:
+        return None
+    if point_view.format != "d" or point_view.ndim != 2:
+        return None
+    if not point_view.c_contiguous:
+        return None
+    return point_view
+
+
+def _tiles_from_buffer(
+    point_view: memoryview, stride: int, tile_size: int
+) -> Iterator[array]:
+    """
+    Copies tiles of points from a buffer of points.
+    The copy is done with a memcpy and the input buffer is not modified.
+    """
+    coord_bytes = point_view.cast("B")
+    tile_nbytes = tile_size * stride * point_view.itemsize
+    for offset in range(0, coord_bytes.nbytes, tile_nbytes):
+        buff = array("d")
+        buff.frombytes(coord_bytes[offset : offset + tile_nbytes])
+        yield buff
+
+
+def _tiles_from_iterable(
+    fst_pt: Any, point_it: Iterator, stride: int, tile_size: int
+) -> Iterator[array]:
+    """
+    Copies tiles of points from an iterable of points.
+    """
+    # chain so the tiles contain the first point that was already acquired
+    point_it = chain((fst_pt,), point_it)
+    while True:
+        points = list(islice(point_it, tile_size))
+        if not points:
+            break
+        # flatten the tile of points to x1,y1,z1,x2,y2,z2,...
+        # in C without a Python level loop over the coordinates.
+        # The coordinates are gathered in a list first so the size is known
+        # & the array is allocated once instead of growing per coordinate.
+        # Only the first stride coordinates of each point are used.
+        buff = array(
+            "d", list(chain.from_iterable(map(islice, points, repeat(stride))))
+        )
+        if len(buff) != len(points) * stride:
+            raise IndexError(f"All points must contain {stride} coordinates.")
+        yield buff
+
+
 class Transformer:
     """
     The Transformer class is for facilitating re-using
@@ -322,6 +413,8 @@ class Transformer:
 
     """
 
+    __slots__ = ("__weakref__", "_local", "_transformer_maker")
+
     def __init__(
         self,
         transformer_maker: TransformerMaker | None = None,
@@ -341,7 +434,7 @@ class Transformer:
         return {"_transformer_maker": self._transformer_maker}
 
     def __setstate__(self, state: dict[str, Any]):
-        self.__dict__.update(state)
+        self._transformer_maker = state["_transformer_maker"]
         self._local = TransformerLocal()
         self._local.transformer = self._transformer_maker()
 
@@ -622,10 +715,10 @@ class Transformer:
         Transformer
 
         """
-        return Transformer(
+        return _transformer_from_crs_cached(
             TransformerFromCRS(
-                cstrencode(CRS.from_user_input(crs_from).srs),
-                cstrencode(CRS.from_user_input(crs_to).srs),
+                cstrencode(_crs_from_user_input(crs_from).srs),
+                cstrencode(_crs_from_user_input(crs_to).srs),
                 always_xy=always_xy,
                 area_of_interest=area_of_interest,
                 authority=authority,
@@ -633,7 +726,9 @@ class Transformer:
                 allow_ballpark=allow_ballpark,
                 force_over=force_over,
                 only_best=only_best,
-            )
+            ),
+            data_dir=get_data_dir(),
+            network_enabled=is_network_enabled(),
         )
 
     @staticmethod
@@ -825,6 +920,28 @@ class Transformer:
             )
         except TypeError:
             pass
+        if (
+            _is_double_c_array(xx)
+            and _is_double_c_array(yy)
+            and (zz is None or _is_double_c_array(zz))
+            and (tt is None or _is_double_c_array(tt))
+        ):
+            # arrays already in the format PROJ expects are used
+            # directly (or copied once) without preparing/converting buffers
+            if not inplace:
+                xx, yy = xx.copy(), yy.copy()
+                zz = None if zz is None else zz.copy()
+                tt = None if tt is None else tt.copy()
+            self._transformer._transform(
+                inx=xx,
+                iny=yy,
+                inz=zz,
+                intime=tt,
+                direction=direction,
+                radians=radians,
+                errcheck=errcheck,
+            )
+            return tuple(data for data in (xx, yy, zz, tt) if data is not None)
         # process inputs, making copies that support buffer API.
         inx, x_data_type = _copytobuffer(xx, inplace=inplace)
         iny, y_data_type = _copytobuffer(yy, inplace=inplace)
@@ -864,6 +981,7 @@ class Transformer:
         radians: bool = False,
         errcheck: bool = False,
         direction: TransformDirection | str = TransformDirection.FORWARD,
+        batch_size: int = _ITRANSFORM_TILE_SIZE,
     ) -> Iterator[Iterable]:
         """
         Iterator/generator version of the function pyproj.Transformer.transform.
@@ -872,11 +990,14 @@ class Transformer:
 
         .. versionadded:: 2.1.1 errcheck
         .. versionadded:: 2.2.0 direction
+        .. versionadded:: 3.8.0 batch_size
 
         Parameters
         ----------
         points: list
-            List of point tuples.
+            List of point tuples. A C contiguous (N, 2), (N, 3) or (N, 4)
+            array of doubles (e.g. :class:`numpy.ndarray`) is copied
+            directly without iterating over the points in Python.
         switch: bool, default=False
             If True x, y or lon,lat coordinates of points are switched to y, x
             or lat, lon. Default is False.
@@ -893,6 +1014,11 @@ class Transformer:
         direction: pyproj.enums.TransformDirection, optional
             The direction of the transform.
             Default is :attr:`pyproj.enums.TransformDirection.FORWARD`.
+        batch_size: int, default=8192
+            The number of points transformed with each call to PROJ.
+            The points are read from the input one batch at a time,
+            so a smaller batch_size yields the first results sooner
+            for lazy or streaming inputs.
 
 
         Example
@@ -945,34 +1071,35 @@ class Transformer:
         '-2.137 0.661'
 
         """
-        point_it = iter(points)  # point iterator
-        # get first point to check stride
-        try:
-            fst_pt = next(point_it)
-        except StopIteration:
-            raise ValueError("iterable must contain at least one point") from None
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0.")
+        point_view = _point_buffer_view(points)
+        if point_view is not None:
+            # fast path for buffers of points (e.g. a (N, 2) float64 numpy array)
+            npts, stride = point_view.shape
+            if npts == 0:
+                raise ValueError("iterable must contain at least one point")
+            tiles = _tiles_from_buffer(point_view, stride, batch_size)
+        else:
+            point_it = iter(points)  # point iterator
+            # get first point to check stride
+            try:
+                fst_pt = next(point_it)
+            except StopIteration:
+                raise ValueError("iterable must contain at least one point") from None
+            stride = len(fst_pt)
+            tiles = _tiles_from_iterable(fst_pt, point_it, stride, batch_size)
 
-        stride = len(fst_pt)
         if stride not in (2, 3, 4):
             raise ValueError("points can contain up to 4 coordinates")
 
         if time_3rd and stride != 3:
             raise ValueError("'time_3rd' is only valid for 3 coordinates.")
 
-        # create a coordinate sequence generator etc. x1,y1,z1,x2,y2,z2,....
-        # chain so the generator returns the first point that was already acquired
-        coord_gen = chain(
-            fst_pt, (coords[c] for coords in point_it for c in range(stride))
-        )
-
-        while True:
-            # create a temporary buffer storage for
-            # the next 64 points (64*stride*8 bytes)
-            buff = array("d", islice(coord_gen, 0, 64 * stride))
-            if len(buff) == 0:
-                break
-
-            self._transformer._transform_sequence(
+        # resolve the thread local transformer once for all of the tiles
+        transform_sequence = self._transformer._transform_sequence
+        for buff in tiles:
+            transform_sequence(
                 stride,
                 buff,
                 switch=switch,
@@ -982,6 +1109,10 @@ class Transformer:
                 errcheck=errcheck,
             )
 
+            # zip over a single iterator groups the coordinates into
+            # point tuples in C. This is faster than slicing a memoryview
+            # or array per point as each slice is a heavier Python object
+            # and faster than struct.iter_unpack on the raw bytes.
             yield from zip(*([iter(buff)] * stride))
 
     def transform_bounds(
@@ -1190,6 +1321,41 @@ class Transformer:
         return self._transformer.is_exact_same(other._transformer)
 
 
+@functools.lru_cache(maxsize=128)
+def _transformer_from_crs_cached(
+    transformer_maker: TransformerFromCRS,
+    data_dir: str,  # pylint: disable=unused-argument
+    network_enabled: bool,  # pylint: disable=unused-argument
+) -> Transformer:
+    """
+    Create a Transformer from CRS data re-using previously created
+    Transformer objects with the same inputs.
+
+    The PROJ data directory & network settings are part of the cache key
+    as they impact the operation selected for the transformation.
+    """
+    return Transformer(transformer_maker)
+
+
+def clear_transformer_cache() -> None:
+    """
+    .. versionadded:: 3.8.0
+
+    Clear the cache of :class:`Transformer` objects
+    created with :meth:`Transformer.from_crs` and
+    :meth:`Transformer.from_proj`.
+
+    This is useful if the transformation grids
+    available to PROJ have changed.
+    """
+    _transformer_from_crs_cached.cache_clear()
+    _crs_from_hashable_input.cache_clear()
+
+
+# resolved once for the deprecated module level functions below
+_transformer_from_proj = Transformer.from_proj
+
+
 def transform(  # pylint: disable=invalid-name
     p1: Any,
     p2: Any,
@@ -1241,16 +1407,8 @@ def transform(  # pylint: disable=invalid-name
     z is always meters.
 
     """
-    warnings.warn(
-        (
-            "This function is deprecated. "
-            "See: https://pyproj4.github.io/pyproj/stable/"
-            "gotchas.html#upgrading-to-pyproj-2-from-pyproj-1"
-        ),
-        FutureWarning,
-        stacklevel=2,
-    )
-    return Transformer.from_proj(p1, p2, always_xy=always_xy).transform(
+    warnings.warn(_DEPRECATION_MSG, FutureWarning, stacklevel=2)
+    return _transformer_from_proj(p1, p2, always_xy=always_xy).transform(
         xx=x, yy=y, zz=z, tt=tt, radians=radians, errcheck=errcheck
     )
 
@@ -1322,15 +1480,7 @@ def itransform(  # pylint: disable=invalid-name
     '30 60'
 
     """
-    warnings.warn(
-        (
-            "This function is deprecated. "
-            "See: https://pyproj4.github.io/pyproj/stable/"
-            "gotchas.html#upgrading-to-pyproj-2-from-pyproj-1"
-        ),
-        FutureWarning,
-        stacklevel=2,
-    )
-    return Transformer.from_proj(p1, p2, always_xy=always_xy).itransform(
+    warnings.warn(_DEPRECATION_MSG, FutureWarning, stacklevel=2)
+    return _transformer_from_proj(p1, p2, always_xy=always_xy).itransform(
         points, switch=switch, time_3rd=time_3rd, radians=radians, errcheck=errcheck
     )
@@ -7,13 +7,16 @@ from array import array
 from enum import Enum, auto
 from typing import Any
 
+_TRUE_STRINGS = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_STRINGS = frozenset(("n", "no", "f", "false", "off", "0"))
+
 
 def is_null(value: Any) -> bool:
     """
     Check if value is NaN or None
     """
     # pylint: disable=comparison-with-itself
-    return value != value or value is None
+    return value is None or value != value
 
 
 def strtobool(value: Any) -> bool:
@@ -25,9 +28,9 @@ def strtobool(value: Any) -> bool:
     Convert a string representation of truth to True or False.
     """
     value = str(value).lower()
-    if value in ("y", "yes", "t", "true", "on", "1"):
+    if value in _TRUE_STRINGS:
         return True
-    if value in ("n", "no", "f", "false", "off", "0"):
+    if value in _FALSE_STRINGS:
         return False
     raise ValueError(f"invalid truth value: '{value}'")
 
@@ -38,18 +41,17 @@ class NumpyEncoder(json.JSONEncoder):
     """
 
     def default(self, obj):  # pylint: disable=arguments-renamed
-        try:
-            return obj.tolist()
-        except AttributeError:
-            pass
-        try:
-            # numpy scalars
-            if obj.dtype.kind == "f":
-                return float(obj)
-            if obj.dtype.kind == "i":
-                return int(obj)
-        except AttributeError:
-            pass
+        # attributes are probed with getattr as raising & catching
+        # AttributeError is slow for the objects without them
+        tolist = getattr(obj, "tolist", None)
+        if tolist is not None:
+            return tolist()
+        # numpy scalars
+        dtype_kind = getattr(getattr(obj, "dtype", None), "kind", None)
+        if dtype_kind == "f":
+            return float(obj)
+        if dtype_kind == "i":
+            return int(obj)
         return json.JSONEncoder.default(self, obj)
 
 
@@ -82,10 +84,62 @@ def _copytobuffer_return_scalar(xxx: Any) -> tuple[array, DataType]:
     """
     try:
         return array("d", (float(xxx),)), DataType.FLOAT
-    except Exception:
+    except (TypeError, ValueError):
         raise TypeError("input must be a scalar") from None
 
 
+def _copytobuffer_list(xxx: list, inplace: bool) -> tuple[array, DataType]:
+    # pylint: disable=unused-argument
+    return array("d", xxx), DataType.LIST
+
+
+def _copytobuffer_tuple(xxx: tuple, inplace: bool) -> tuple[array, DataType]:
+    # pylint: disable=unused-argument
+    return array("d", xxx), DataType.TUPLE
+
+
+def _copytobuffer_array(xxx: array, inplace: bool) -> tuple[array, DataType]:
+    if not inplace or xxx.typecode != "d":
+        xxx = array("d", xxx)
+    return xxx, DataType.ARRAY
+
+
+def _copytobuffer_scalar(xxx: Any, inplace: bool) -> tuple[array, DataType]:
+    # pylint: disable=unused-argument
+    return _copytobuffer_return_scalar(xxx)
+
+
+# handlers for the builtin types by exact type to skip
+# the attribute checks done for array-like objects
+_COPYTOBUFFER_BY_TYPE = {
+    list: _copytobuffer_list,
+    tuple: _copytobuffer_tuple,
+    array: _copytobuffer_array,
+    float: _copytobuffer_scalar,
+    int: _copytobuffer_scalar,
+}
+
+
+def _is_double_c_array(xxx: Any) -> bool:
+    """
+    Check if the data is a numpy array that is already in the
+    format expected by the PROJ C-API (non-scalar, double data type
+    & C order) and does not need to be prepared by _copytobuffer.
+
+    Subclasses of numpy.ndarray (e.g. masked arrays, matrices or
+    arrays with units) are excluded so they are converted to a
+    plain numpy.ndarray by _copytobuffer.
+    """
+    xxx_type = type(xxx)
+    return (
+        xxx_type.__name__ == "ndarray"
+        and xxx_type.__module__ == "numpy"
+        and xxx.ndim > 0
+        and xxx.dtype == "d"
+        and xxx.flags.c_contiguous
+    )
+
+
 def _copytobuffer(xxx: Any, inplace: bool = False) -> tuple[Any, DataType]:
     """
     Prepares data for PROJ C-API:
@@ -109,6 +163,9 @@ def _copytobuffer(xxx: Any, inplace: bool = False) -> tuple[Any, DataType]:
     tuple[Any, DataType]
         The copy of the data prepared for the PROJ API & Python Buffer API.
     """
+    copy_func = _COPYTOBUFFER_BY_TYPE.get(type(xxx))
+    if copy_func is not None:
+        return copy_func(xxx, inplace)
     # check for pandas.Series, xarray.DataArray or dask.array.Array
     # also handle numpy masked Arrays; note that pandas.Series also has a
     # "mask" attribute, hence checking for simply the "mask" attr in that
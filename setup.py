@@ -14,6 +14,10 @@ BASE_INTERNAL_PROJ_DIR = Path("proj_dir")
 INTERNAL_PROJ_DIR = CURRENT_FILE_PATH / "pyproj" / BASE_INTERNAL_PROJ_DIR
 PROJ_VERSION_SEARCH = re.compile(r".*Rel\.\s+(?P<version>\d+\.\d+\.\d+).*")
 VERSION_SEARCH = re.compile(r".*(?P<version>\d+\.\d+\.\d+).*")
+PROJ_HEADER_VERSION_SEARCH = re.compile(
+    r"^#define\s+PROJ_VERSION_(?P<part>MAJOR|MINOR|PATCH)\s+(?P<number>\d+)",
+    re.MULTILINE,
+)
 
 
 def _parse_version(version: str) -> tuple[int, int, int]:
@@ -29,16 +33,42 @@ def _parse_version(version: str) -> tuple[int, int, int]:
     )
 
 
-def get_proj_version(proj_dir: Path) -> tuple[int, int, int]:
+def _parse_proj_header_version(include_dirs: list[str]) -> tuple[int, int, int] | None:
+    """Read the PROJ version from the proj.h header if it can be found."""
+    for include_dir in include_dirs:
+        try:
+            proj_header = (Path(include_dir) / "proj.h").read_text(
+                encoding="utf-8", errors="ignore"
+            )
+        except OSError:
+            continue
+        version_parts = {
+            match.group("part"): int(match.group("number"))
+            for match in PROJ_HEADER_VERSION_SEARCH.finditer(proj_header)
+        }
+        if len(version_parts) == 3:
+            return (
+                version_parts["MAJOR"],
+                version_parts["MINOR"],
+                version_parts["PATCH"],
+            )
+    return None
+
+
+def get_proj_version(proj_dir: Path, include_dirs: list[str]) -> tuple[int, int, int]:
     """
     Determine PROJ version.
 
     Prefer PROJ_VERSION environment variable.
-    If PROJ_VERSION is not set, try to determine the version from the PROJ executable.
+    If PROJ_VERSION is not set, try to determine the version from the proj.h
+    header and then from the PROJ executable.
     """
     proj_version = os.environ.get("PROJ_VERSION")
     if proj_version:
         return _parse_version(proj_version)
+    header_version = _parse_proj_header_version(include_dirs)
+    if header_version is not None:
+        return header_version
     proj = proj_dir / "bin" / "proj"
     proj_ver = subprocess.check_output(str(proj), stderr=subprocess.STDOUT).decode(
         "ascii"
@@ -69,13 +99,15 @@ def get_proj_dir() -> Path:
     This function finds the base PROJ directory.
     """
     proj_dir_environ = os.environ.get("PROJ_DIR")
-    proj_dir: Path | None = None
     if proj_dir_environ is not None:
         proj_dir = Path(proj_dir_environ)
-    if proj_dir is None and INTERNAL_PROJ_DIR.exists():
+        if not proj_dir.exists():
+            raise SystemExit(f"ERROR: Invalid path for PROJ_DIR {proj_dir}")
+        print("PROJ_DIR is set, using existing PROJ installation..\n")
+    elif INTERNAL_PROJ_DIR.exists():
         proj_dir = INTERNAL_PROJ_DIR
         print(f"Internally compiled directory being used {INTERNAL_PROJ_DIR}.")
-    elif proj_dir is None and not INTERNAL_PROJ_DIR.exists():
+    else:
         proj = shutil.which("proj", path=sys.prefix)
         if proj is None:
             proj = shutil.which("proj")
@@ -86,10 +118,6 @@ def get_proj_dir() -> Path:
                 "https://pyproj4.github.io/pyproj/stable/installation.html"
             )
         proj_dir = Path(proj).parent.parent
-    elif proj_dir is not None and proj_dir.exists():
-        print("PROJ_DIR is set, using existing PROJ installation..\n")
-    else:
-        raise SystemExit(f"ERROR: Invalid path for PROJ_DIR {proj_dir}")
     return proj_dir
 
 
@@ -137,7 +165,7 @@ def get_cythonize_options():
     """
     # Configure optional Cython coverage.
     cythonize_options = {
-        "language_level": sys.version_info[0],
+        "language_level": 3,
         "compiler_directives": {
             "c_string_type": "str",
             "c_string_encoding": "utf-8",
@@ -147,6 +175,16 @@ def get_cythonize_options():
     if os.environ.get("PYPROJ_FULL_COVERAGE"):
         cythonize_options["compiler_directives"].update(linetrace=True)
         cythonize_options["annotate"] = True
+    # Cythonize the extension modules in parallel.
+    # With the spawn start method (Windows & macOS) the worker
+    # processes re-import setup.py, see the __main__ guard below.
+    build_jobs = os.environ.get("PYPROJ_BUILD_JOBS")
+    if build_jobs:
+        cythonize_options["nthreads"] = int(build_jobs)
+    # Reuse previously generated C files when the sources are unchanged.
+    cython_cache = os.environ.get("PYPROJ_CYTHON_CACHE")
+    if cython_cache:
+        cythonize_options["cache"] = cython_cache
     return cythonize_options
 
 
@@ -157,9 +195,10 @@ def get_libraries(libdirs: list[str]) -> list[str]:
     libraries = ["proj"]
     if os.name == "nt":
         for libdir in libdirs:
-            projlib = list(Path(libdir).glob("proj*.lib"))
-            if projlib:
-                libraries = [str(projlib[0].stem)]
+            # stop scanning the directory at the first match
+            projlib = next(Path(libdir).glob("proj*.lib"), None)
+            if projlib is not None:
+                libraries = [projlib.stem]
                 break
     return libraries
 
@@ -168,7 +207,9 @@ def get_extension_modules():
     """
     This function retrieves the extension modules
     """
-    if "clean" in sys.argv:
+    # the extension modules are not built when cleaning or
+    # creating a source distribution (sources are in MANIFEST.in)
+    if "clean" in sys.argv or "sdist" in sys.argv:
         return None
 
     # make sure cython is available
@@ -185,7 +226,7 @@ def get_extension_modules():
     library_dirs = get_proj_libdirs(proj_dir)
     include_dirs = get_proj_incdirs(proj_dir)
 
-    proj_version = get_proj_version(proj_dir)
+    proj_version = get_proj_version(proj_dir, include_dirs)
     check_proj_version(proj_version)
     proj_version_major, proj_version_minor, proj_version_patch = proj_version
 
@@ -243,10 +284,26 @@ def get_package_data() -> dict[str, list[str]]:
     return package_data
 
 
+def get_command_options() -> dict[str, dict[str, int]]:
+    """
+    This function retrieves the options for the setup commands
+    """
+    command_options = {}
+    build_jobs = os.environ.get("PYPROJ_BUILD_JOBS")
+    if build_jobs:
+        # compile the extension modules in parallel
+        command_options["build_ext"] = {"parallel": int(build_jobs)}
+    return command_options
+
+
 # static items in pyproject.toml
-setup(
-    ext_modules=get_extension_modules(),
-    package_data=get_package_data(),
-    # temptorary hack to add in metadata
-    url="https://github.com/pyproj4/pyproj",
-)
+# setup() is guarded so it is not called again when setup.py is
+# re-imported by the cythonize worker processes (PYPROJ_BUILD_JOBS).
+if __name__ == "__main__":
+    setup(
+        ext_modules=get_extension_modules(),
+        package_data=get_package_data(),
+        options=get_command_options(),
+        # temptorary hack to add in metadata
+        url="https://github.com/pyproj4/pyproj",
+    )
@@ -1,7 +1,9 @@
 import concurrent.futures
 import os
 import pickle
+import weakref
 from array import array
+from collections import deque
 from functools import partial
 from glob import glob
 from itertools import permutations
@@ -17,7 +19,12 @@ from pyproj import CRS, Proj, Transformer, itransform, transform
 from pyproj.datadir import append_data_dir
 from pyproj.enums import TransformDirection
 from pyproj.exceptions import ProjError
-from pyproj.transformer import AreaOfInterest, TransformerGroup
+from pyproj.transformer import (
+    AreaOfInterest,
+    TransformerGroup,
+    _crs_from_user_input,
+    clear_transformer_cache,
+)
 from test.conftest import PROJ_GTE_93, grids_available, proj_env, proj_network_env
 
 
@@ -207,6 +214,73 @@ def test_3d_time_itransform():
     )
 
 
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_itransform__numpy_points(order):
+    transformer = Transformer.from_crs(4326, 2100)
+    points = numpy.array(
+        [(22.95, 40.63), (22.81, 40.53), (23.51, 40.86)],
+        dtype=numpy.float64,
+        order=order,
+    )
+    points_copy = points.copy()
+    assert_almost_equal(
+        list(transformer.itransform(points)),
+        list(transformer.itransform(points.tolist())),
+    )
+    assert_array_equal(points, points_copy)
+
+
+def test_itransform__numpy_points__empty():
+    transformer = Transformer.from_crs(4326, 2100)
+    with pytest.raises(ValueError, match="iterable must contain at least one point"):
+        list(transformer.itransform(numpy.empty((0, 2))))
+
+
+def test_itransform__mixed_point_lengths():
+    transformer = Transformer.from_crs(4326, 2100)
+    # extra coordinates are ignored
+    assert_almost_equal(
+        list(
+            transformer.itransform(
+                [(22.95, 40.63), [22.95, 40.63, 0], numpy.array([22.95, 40.63])]
+            )
+        ),
+        [(2221638.801, 2637034.372)] * 3,
+        decimal=3,
+    )
+    with pytest.raises(IndexError, match="All points must contain 3 coordinates"):
+        list(transformer.itransform([(22.95, 40.63, 0), (22.95, 40.63)]))
+
+
+def test_itransform__deque_points():
+    transformer = Transformer.from_crs(4326, 2100)
+    # points only need to support iteration, not slicing
+    assert_almost_equal(
+        list(transformer.itransform([deque([22.95, 40.63]), deque([22.81, 40.53, 0])])),
+        [(2221638.801, 2637034.372), (2212924.125, 2619851.898)],
+        decimal=3,
+    )
+    with pytest.raises(IndexError, match="All points must contain 2 coordinates"):
+        list(transformer.itransform([deque([22.95, 40.63]), deque([22.81])]))
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 100])
+@pytest.mark.parametrize("as_numpy", [True, False])
+def test_itransform__batch_size(batch_size, as_numpy):
+    transformer = Transformer.from_crs(4326, 2100)
+    points = [(22.95, 40.63), (22.81, 40.53), (23.51, 40.86)]
+    expected = list(transformer.itransform(points))
+    if as_numpy:
+        points = numpy.array(points)
+    assert list(transformer.itransform(points, batch_size=batch_size)) == expected
+
+
+def test_itransform__batch_size__invalid():
+    transformer = Transformer.from_crs(4326, 2100)
+    with pytest.raises(ValueError, match="batch_size must be greater than 0"):
+        list(transformer.itransform([(22.95, 40.63)], batch_size=0))
+
+
 def test_4d_itransform_orginal_crs_obs1():
     with pytest.warns(FutureWarning):
         assert_almost_equal(
@@ -629,6 +703,7 @@ def test_transformer_group():
     assert trans_group.transformers[1].description == ("ITRF2014 to ETRF2014 (1)")
     assert not trans_group.unavailable_operations
     assert trans_group.best_available
+    assert trans_group.transformers is trans_group.transformers
 
 
 @pytest.mark.grid
@@ -784,6 +859,38 @@ def test_transformer_equals():
     )
 
 
+def test_transformer_from_crs__cached():
+    transformer = Transformer.from_crs(4326, 3857)
+    assert Transformer.from_crs("EPSG:4326", "EPSG:3857") is transformer
+    assert Transformer.from_crs(4326, 3857, always_xy=True) is not transformer
+    clear_transformer_cache()
+    assert Transformer.from_crs(4326, 3857) is not transformer
+
+
+def test_transformer__slots():
+    transformer = Transformer.from_crs(4326, 3857)
+    assert not hasattr(transformer, "__dict__")
+    assert weakref.ref(transformer)() is transformer
+
+
+def test_crs_from_user_input__cached():
+    crs = _crs_from_user_input("EPSG:4326")
+    assert _crs_from_user_input("EPSG:4326") is crs
+    assert _crs_from_user_input(4326) == crs
+    assert _crs_from_user_input(crs.to_dict()) is not crs
+    assert _crs_from_user_input(crs) is crs
+    clear_transformer_cache()
+    assert _crs_from_user_input("EPSG:4326") is not crs
+
+
+def test_transformer_from_crs__cached__network():
+    with proj_network_env():
+        pyproj.network.set_network_enabled(active=False)
+        transformer = Transformer.from_crs(4326, 3857)
+        pyproj.network.set_network_enabled(active=True)
+        assert Transformer.from_crs(4326, 3857) is not transformer
+
+
 @pytest.mark.parametrize(
     "comparison",
     [Transformer.from_pipeline("+proj=pipeline +ellps=GRS80 +step +proj=cart"), 22],
@@ -1543,6 +1650,64 @@ def test_4d_transform__inplace__numpy__int():
     assert tarr[0] == 2019
 
 
+def test_transform__inplace__numpy__mixed_inputs():
+    transformer = Transformer.from_crs(4326, 3857, always_xy=True)
+    xarr = numpy.array([[1.0, 2.0], [3.0, 4.0]])
+    yarr = numpy.array([[5.0, 6.0], [7.0, 8.0]])
+    xxx, yyy = transformer.transform(xarr, yarr)
+    t_xarr, t_yarr = transformer.transform(xx=xarr, yy=yarr, inplace=True)
+    assert xarr is t_xarr
+    assert yarr is t_yarr
+    assert_almost_equal(t_xarr, xxx)
+    assert_almost_equal(t_yarr, yyy)
+    # the fast path is only used if all of the inputs can be modified in place
+    xarr = numpy.array([1.0, 2.0])
+    t_xarr, t_yarr = transformer.transform(xx=xarr, yy=[5.0, 6.0], inplace=True)
+    assert xarr is t_xarr
+    assert_almost_equal(t_yarr, yyy[0])
+
+
+def test_transform__numpy__not_inplace():
+    transformer = Transformer.from_crs(4326, 3857, always_xy=True)
+    xarr = numpy.array([1.0, 2.0])
+    yarr = numpy.array([5.0, 6.0])
+    t_xarr, t_yarr = transformer.transform(xarr, yarr)
+    assert t_xarr is not xarr
+    assert t_yarr is not yarr
+    assert_array_equal(xarr, [1.0, 2.0])
+    assert_array_equal(yarr, [5.0, 6.0])
+    assert_almost_equal(t_xarr, transformer.transform([1.0, 2.0], [5.0, 6.0])[0])
+
+
+class _NDArraySubclass(numpy.ndarray):
+    pass
+
+
+def test_transform__numpy_subclass():
+    transformer = Transformer.from_crs(4326, 3857, always_xy=True)
+    xarr = numpy.array([1.0, 2.0]).view(_NDArraySubclass)
+    yarr = numpy.array([5.0, 6.0]).view(_NDArraySubclass)
+    t_xarr, t_yarr = transformer.transform(xarr, yarr)
+    assert type(t_xarr) is numpy.ndarray
+    assert type(t_yarr) is numpy.ndarray
+    assert_array_equal(xarr, [1.0, 2.0])
+    assert_almost_equal(t_xarr, transformer.transform([1.0, 2.0], [5.0, 6.0])[0])
+
+
+def test_transform__inplace__numpy_subclass():
+    transformer = Transformer.from_crs(4326, 3857, always_xy=True)
+    xxx, yyy = transformer.transform([1.0, 2.0], [5.0, 6.0])
+    xarr = numpy.array([1.0, 2.0]).view(_NDArraySubclass)
+    yarr = numpy.array([5.0, 6.0]).view(_NDArraySubclass)
+    t_xarr, t_yarr = transformer.transform(xarr, yarr, inplace=True)
+    assert type(t_xarr) is numpy.ndarray
+    assert type(t_yarr) is numpy.ndarray
+    assert numpy.shares_memory(t_xarr, xarr)
+    assert numpy.shares_memory(t_yarr, yarr)
+    assert_almost_equal(xarr, xxx)
+    assert_almost_equal(yarr, yyy)
+
+
 def test_transformer_source_target_crs():
     transformer = Transformer.from_crs("EPSG:4326", "EPSG:4258")
     assert transformer.source_crs == "EPSG:4326"
@@ -1,9 +1,15 @@
+import json
 from array import array
 
 import numpy
 import pytest
 
-from pyproj.utils import DataType, _copytobuffer, _copytobuffer_return_scalar
+from pyproj.utils import (
+    DataType,
+    NumpyEncoder,
+    _copytobuffer,
+    _copytobuffer_return_scalar,
+)
 
 
 @pytest.mark.parametrize("in_data", [numpy.array(1), 1])
@@ -59,6 +65,16 @@ def test__copytobuffer__numpy_masked_array():
     assert isinstance(out_arr, numpy.ma.MaskedArray)
 
 
+@pytest.mark.parametrize("inplace", [True, False])
+@pytest.mark.parametrize("typecode", ["d", "i"])
+def test__copytobuffer__python_array(inplace, typecode):
+    in_arr = array(typecode, [1])
+    out_arr, data_type = _copytobuffer(in_arr, inplace=inplace)
+    assert out_arr == array("d", [1])
+    assert data_type == DataType.ARRAY
+    assert (out_arr is in_arr) == (inplace and typecode == "d")
+
+
 def test__copytobuffer__fortran_order():
     data = numpy.ones((2, 4), dtype=numpy.float64, order="F")
     converted_data, dtype = _copytobuffer(data)
@@ -70,3 +86,20 @@ def test__copytobuffer__fortran_order():
 def test__copytobuffer__invalid():
     with pytest.raises(TypeError):
         _copytobuffer("invalid")
+
+
+@pytest.mark.parametrize(
+    "in_data, expected",
+    [
+        (numpy.array([1.5, 2]), "[1.5, 2.0]"),
+        (numpy.float32(1.5), "1.5"),
+        (numpy.int64(2), "2"),
+    ],
+)
+def test_numpy_encoder(in_data, expected):
+    assert json.dumps(in_data, cls=NumpyEncoder) == expected
+
+
+def test_numpy_encoder__invalid():
+    with pytest.raises(TypeError):
+        json.dumps(object(), cls=NumpyEncoder)